@@ -5,21 +5,27 @@ Build and distribution script for upserver.
 This script helps with building, testing, and distributing the upserver package.
 """
 
+import os
 import sys
 import subprocess
 import shutil
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Only emit ANSI escapes on an interactive terminal, honouring NO_COLOR
+# (an empty NO_COLOR counts as unset)
+_USE_COLORS = sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+
 
 # Colors for terminal output
 class Colors:
-    BLUE = "\033[94m"
-    GREEN = "\033[92m"
-    YELLOW = "\033[93m"
-    RED = "\033[91m"
-    ENDC = "\033[0m"
-    BOLD = "\033[1m"
+    BLUE = "\033[94m" if _USE_COLORS else ""
+    GREEN = "\033[92m" if _USE_COLORS else ""
+    YELLOW = "\033[93m" if _USE_COLORS else ""
+    RED = "\033[91m" if _USE_COLORS else ""
+    ENDC = "\033[0m" if _USE_COLORS else ""
+    BOLD = "\033[1m" if _USE_COLORS else ""
 
 
 def print_step(message):
@@ -63,37 +69,49 @@ def run_command(cmd, description=None):
         return False
 
 
+# Directory names removed by clean() at the repository root only
+CLEAN_ROOT_TARGETS = {"build", "dist"}
+CLEAN_ROOT_SUFFIX_TARGETS = (".egg-info",)
+# Directory names removed by clean() wherever they appear in the tree
+CLEAN_TARGETS = {".pytest_cache", "__pycache__"}
+# Directories clean() never descends into
+CLEAN_SKIP = {".git", ".venv", "venv", ".tox", ".nox"}
+
+
 def clean():
     """Clean build artifacts."""
     print_step("Cleaning build artifacts...")
 
-    dirs_to_clean = [
-        "build",
-        "dist",
-        "*.egg-info",
-        "__pycache__",
-        ".pytest_cache",
-        "upserver/__pycache__",
-        "tests/__pycache__",
-    ]
-
-    for pattern in dirs_to_clean:
-        for path in Path(".").glob(pattern):
-            if path.is_dir():
+    # Single top-down pass; matched directories are pruned so we never walk
+    # into something we are about to delete
+    for root, dirs, _ in os.walk("."):
+        at_root = root == "."
+        for name in list(dirs):
+            if name in CLEAN_SKIP:
+                dirs.remove(name)
+            elif name in CLEAN_TARGETS or (
+                at_root
+                and (
+                    name in CLEAN_ROOT_TARGETS
+                    or name.endswith(CLEAN_ROOT_SUFFIX_TARGETS)
+                )
+            ):
+                path = os.path.join(root, name)
                 shutil.rmtree(path)
+                dirs.remove(name)
                 print(f"Removed directory: {path}")
-            elif path.is_file():
-                path.unlink()
-                print(f"Removed file: {path}")
 
     print_success("Clean completed")
 
 
 def install_dev_dependencies():
     """Install development dependencies."""
-    deps = ["build", "twine", "pytest", "pytest-cov", "black", "flake8", "mypy"]
-
-    cmd = f"pip install {' '.join(deps)}"
+    # A requirements file lets pip's wheel cache (and any CI cache of
+    # ~/.cache/pip keyed on its hash) be reused across runs
+    cmd = (
+        "pip install --disable-pip-version-check --prefer-binary "
+        "-r requirements-dev.txt"
+    )
     return run_command(cmd, "Installing development dependencies")
 
 
@@ -101,9 +119,11 @@ def run_tests():
     """Run the test suite."""
     print_step("Running test suite...")
 
-    # Run tests with coverage
+    # Run tests with coverage, distributing individual tests across all cores
+    # (each test gets its own temp dir, so no grouping by file is needed)
     if not run_command(
-        "python -m pytest tests/ -v --cov=upserver --cov-report=term-missing"
+        "python -m pytest tests/ -v -n auto --dist=load "
+        "--cov=upserver --cov-report=term-missing"
     ):
         return False
 
@@ -112,33 +132,73 @@ def run_tests():
 
 
 def check_code_quality():
-    """Run code quality checks."""
+    """Run code quality checks in parallel."""
     print_step("Running code quality checks...")
 
-    # Check code formatting with black
-    if not run_command(
-        "python -m black --check upserver/ tests/", "Checking code formatting"
-    ):
-        print_warning(
+    checks = [
+        (
+            "Code formatting",
+            [sys.executable, "-m", "black", "--check", "upserver/", "tests/"],
             "Code formatting issues found. "
-            "Run 'python -m black upserver/ tests/' to fix."
-        )
-        return False
+            "Run 'python -m black upserver/ tests/' to fix.",
+        ),
+        (
+            "Linting",
+            [
+                sys.executable,
+                "-m",
+                "flake8",
+                "upserver/",
+                "tests/",
+                "--max-line-length=88",
+                "--extend-ignore=E203,W503",
+            ],
+            "Linting issues found.",
+        ),
+        (
+            "Type checking",
+            [sys.executable, "-m", "mypy", "upserver/", "--ignore-missing-imports"],
+            "Type checking issues found.",
+        ),
+    ]
 
-    # Run flake8 for linting
-    flake8_cmd = (
-        "python -m flake8 upserver/ tests/ --max-line-length=88 "
-        "--extend-ignore=E203,W503"
-    )
-    if not run_command(flake8_cmd, "Running linting"):
-        print_warning("Linting issues found.")
-        return False
+    # The tools are independent, so run them concurrently and report afterwards
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [
+            (
+                name,
+                warning,
+                executor.submit(
+                    subprocess.run,
+                    cmd,
+                    check=False,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                ),
+            )
+            for name, cmd, warning in checks
+        ]
+
+    passed = True
+    for name, warning, future in futures:
+        try:
+            result = future.result()
+        except OSError as e:
+            # The tool could not be started at all (e.g. missing interpreter)
+            passed = False
+            print_error(f"{name} failed: {e}")
+            continue
+        if result.returncode == 0:
+            print_success(f"{name} passed")
+            continue
+        passed = False
+        print_error(f"{name} failed")
+        if result.stdout:
+            print(result.stdout)
+        print_warning(warning)
 
-    # Run type checking with mypy
-    if not run_command(
-        "python -m mypy upserver/ --ignore-missing-imports", "Running type checking"
-    ):
-        print_warning("Type checking issues found.")
+    if not passed:
         return False
 
     print_success("Code quality checks passed")
@@ -213,7 +273,7 @@ Usage: python build.py <command>
 
 Commands:
   clean          Clean build artifacts
-  deps           Install development dependencies
+  deps           Install development dependencies (from requirements-dev.txt)
   test           Run test suite
   quality        Run code quality checks
   build          Build package (includes clean, test, quality)
@@ -226,6 +286,8 @@ Examples:
   python build.py test
   python build.py full
   python build.py upload-test
+
+CI tip: cache ~/.cache/pip keyed on the hash of requirements-dev.txt
         """
         )
         sys.exit(1)
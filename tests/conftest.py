@@ -0,0 +1,15 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+
+from upserver.utils import clear_disk_space_cache
+
+
+@pytest.fixture(autouse=True)
+def _reset_disk_space_cache():
+    """Keep cached disk usage from leaking between tests."""
+    clear_disk_space_cache()
+    yield
+    clear_disk_space_cache()
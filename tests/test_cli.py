@@ -0,0 +1,33 @@
+"""
+Tests for the command-line interface.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from upserver import __version__
+
+
+class TestCli:
+    """Test cases for the upserver CLI."""
+
+    def test_version_fast_path(self):
+        """Test that --version prints the version without heavy imports."""
+        # Run in a fresh interpreter: pytest itself has already imported argparse
+        code = (
+            "import sys\n"
+            "sys.argv = ['upserver', '--version']\n"
+            "from upserver.cli import main\n"
+            "main()\n"
+            "print('argparse' in sys.modules, 'upserver.server' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parent.parent,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.stdout.splitlines() == [f"upserver {__version__}", "False False"]
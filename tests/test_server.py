@@ -2,9 +2,11 @@
 Tests for the FileServer class.
 """
 
+import gc
+import io
+import os
+import warnings
 import pytest
-import tempfile
-import shutil
 from pathlib import Path
 from upserver.server import FileServer
 
@@ -13,11 +15,9 @@ class TestFileServer:
     """Test cases for FileServer class."""
 
     @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for testing."""
-        temp = tempfile.mkdtemp()
-        yield temp
-        shutil.rmtree(temp)
+    def temp_dir(self, tmp_path_factory):
+        """Create a temporary directory for testing (cleaned up by pytest)."""
+        return str(tmp_path_factory.mktemp("fs"))
 
     def test_initialization(self, temp_dir):
         """Test FileServer initialization."""
@@ -53,6 +53,41 @@ class TestFileServer:
         downloaded_data = server.download_file(filename)
         assert downloaded_data == test_data
 
+    def test_upload_file_stream(self, temp_dir):
+        """Test streaming upload from a file-like object."""
+        server = FileServer(upload_dir=temp_dir, chunk_size=4)
+        test_data = b"Streamed content spanning several chunks"
+
+        result = server.upload_file_stream(io.BytesIO(test_data), "stream.bin")
+
+        assert result.name == "stream.bin"
+        assert result.read_bytes() == test_data
+
+    def test_iter_download(self, temp_dir):
+        """Test chunked download functionality."""
+        server = FileServer(upload_dir=temp_dir, chunk_size=4)
+        test_data = b"0123456789"
+        server.upload_file(test_data, "chunks.bin")
+
+        chunks = list(server.iter_download("chunks.bin"))
+        assert chunks == [b"0123", b"4567", b"89"]
+
+        with pytest.raises(FileNotFoundError):
+            server.iter_download("nonexistent.bin")
+
+    def test_iter_download_unconsumed_closes_file(self, temp_dir):
+        """Test that an iterator that is never consumed leaks no file handle."""
+        server = FileServer(upload_dir=temp_dir)
+        server.upload_file(b"data", "unused.bin")
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", ResourceWarning)
+            chunks = server.iter_download("unused.bin")
+            del chunks
+            gc.collect()
+
+        assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+
     def test_download_nonexistent_file(self, temp_dir):
         """Test downloading a file that doesn't exist."""
         server = FileServer(upload_dir=temp_dir)
@@ -76,15 +111,36 @@ class TestFileServer:
         assert "file1.txt" in files
         assert "file2.txt" in files
 
-    def test_upload_directory_creation(self):
+    def test_iter_files(self, temp_dir):
+        """Test listing files together with their sizes."""
+        server = FileServer(upload_dir=temp_dir)
+        server.upload_file(b"abc", "small.txt")
+        server.upload_file(b"abcdef", "bigger.txt")
+
+        # The temp subdirectory must not be reported
+        assert sorted(server.iter_files()) == [("bigger.txt", 6), ("small.txt", 3)]
+
+    def test_listing_follows_symlinks(self, temp_dir, tmp_path):
+        """Test that symlinked files are listed, as the /files endpoint does."""
+        server = FileServer(upload_dir=temp_dir)
+        target = tmp_path / "target.bin"
+        target.write_bytes(b"12345")
+        try:
+            os.symlink(target, Path(temp_dir) / "link.bin")
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks are not supported here")
+
+        assert server.list_files() == ["link.bin"]
+        assert list(server.iter_files()) == [("link.bin", 5)]
+
+    def test_upload_directory_creation(self, temp_dir):
         """Test that upload directory is created if it doesn't exist."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            upload_path = Path(temp_dir) / "new_uploads"
-            assert not upload_path.exists()
+        upload_path = Path(temp_dir) / "new_uploads"
+        assert not upload_path.exists()
 
-            # server = FileServer(upload_dir=str(upload_path))
-            FileServer(upload_dir=str(upload_path))  # noqa: F841
-            assert upload_path.exists()
+        # server = FileServer(upload_dir=str(upload_path))
+        FileServer(upload_dir=str(upload_path))  # noqa: F841
+        assert upload_path.exists()
 
     def test_path_traversal_protection_upload(self, temp_dir):
         """Test that path traversal attacks are prevented in upload."""
@@ -0,0 +1,101 @@
+"""
+Tests for the utility functions.
+"""
+
+import json
+
+import pytest
+
+from upserver import utils
+from upserver.utils import get_disk_space, get_system_info, sanitize_filename
+
+GB = 1024**3
+
+
+class TestSanitizeFilename:
+    """Test cases for sanitize_filename."""
+
+    def test_windows_path(self):
+        """Test that Windows directory components are stripped on any OS."""
+        assert sanitize_filename("C:\\dir\\x.txt") == "x.txt"
+
+    def test_mixed_separators(self):
+        """Test that both separator styles are treated as directory breaks."""
+        assert sanitize_filename("a/b\\c") == "c"
+
+    def test_inner_quotes_preserved(self):
+        """Test that only surrounding quotes are removed."""
+        assert sanitize_filename("it's.txt") == "it's.txt"
+        assert sanitize_filename('"it\'s.txt"') == "it's.txt"
+
+
+class TestGetDiskSpace:
+    """Test cases for get_disk_space caching."""
+
+    @pytest.fixture
+    def disk_usage_calls(self, monkeypatch):
+        """Replace shutil.disk_usage with a fake that records its calls."""
+        calls = []
+
+        def fake_disk_usage(path):
+            calls.append(path)
+            return 4 * GB, 3 * GB, 1 * GB
+
+        monkeypatch.setattr(utils.shutil, "disk_usage", fake_disk_usage)
+        return calls
+
+    def test_cache_hit_within_ttl(self, disk_usage_calls):
+        """Test that a second call within the TTL reuses the cached value."""
+        assert get_disk_space("/data", ttl=60) == (4.0, 3.0, 1.0)
+        assert get_disk_space("/data", ttl=60) == (4.0, 3.0, 1.0)
+        assert disk_usage_calls == ["/data"]
+
+    def test_cache_expires_after_ttl(self, disk_usage_calls, monkeypatch):
+        """Test that the cached value is refreshed once the TTL has passed."""
+        now = [100.0]
+        monkeypatch.setattr(utils.time, "monotonic", lambda: now[0])
+
+        get_disk_space("/data", ttl=2.0)
+        now[0] += 2.5
+        get_disk_space("/data", ttl=2.0)
+        assert disk_usage_calls == ["/data", "/data"]
+
+    def test_zero_ttl_bypasses_cache(self, disk_usage_calls):
+        """Test that ttl=0 always queries the filesystem."""
+        get_disk_space("/data", ttl=0)
+        get_disk_space("/data", ttl=0)
+        assert disk_usage_calls == ["/data", "/data"]
+
+    def test_different_path_misses_cache(self, disk_usage_calls):
+        """Test that a cached result is only reused for the same path."""
+        get_disk_space("/data", ttl=60)
+        get_disk_space("/other", ttl=60)
+        assert disk_usage_calls == ["/data", "/other"]
+
+    def test_errors_are_not_cached(self, monkeypatch):
+        """Test that a failed lookup is retried on the next call."""
+        results = [OSError("disk gone"), (4 * GB, 3 * GB, 1 * GB)]
+
+        def flaky_disk_usage(path):
+            result = results.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        monkeypatch.setattr(utils.shutil, "disk_usage", flaky_disk_usage)
+
+        assert get_disk_space("/data", ttl=60) == (0.0, 0.0, 0.0)
+        assert get_disk_space("/data", ttl=60) == (4.0, 3.0, 1.0)
+
+
+class TestGetSystemInfo:
+    """Test cases for get_system_info."""
+
+    def test_returns_independent_dicts(self):
+        """Test that each call returns a fresh, serializable dict."""
+        info = get_system_info()
+        assert isinstance(info, dict)
+        assert json.loads(json.dumps(info)) == info
+
+        info["system"] = "modified"
+        assert get_system_info()["system"] != "modified"
@@ -17,11 +17,15 @@ __version__ = "0.2.0"
 __author__ = "Álex Vieira"
 __license__ = "MIT"
 
-from .server import FileServer
+from typing import TYPE_CHECKING
+
 from .config import ServerConfig
 from .logging_config import setup_logging, ServerLogger
 from .utils import sanitize_filename, get_disk_space, format_file_size
 
+if TYPE_CHECKING:
+    from .server import FileServer
+
 __all__ = [
     "FileServer",
     "ServerConfig",
@@ -31,3 +35,18 @@ __all__ = [
     "get_disk_space",
     "format_file_size",
 ]
+
+
+def __getattr__(name):
+    """
+    Import FileServer on first access (PEP 562).
+
+    The server module pulls in http.server, which is not needed by code that
+    only reads the version or uses the configuration and utility helpers.
+    """
+    if name == "FileServer":
+        from .server import FileServer
+
+        globals()["FileServer"] = FileServer
+        return FileServer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
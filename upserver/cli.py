@@ -2,11 +2,9 @@
 Command-line interface for the upserver package.
 """
 
-import argparse
 import sys
 
 
-from .server import FileServer
 from .config import ServerConfig
 from .logging_config import setup_logging, ServerLogger
 from . import __version__
@@ -19,6 +17,9 @@ def create_parser():
     Returns:
         argparse.ArgumentParser: Configured argument parser
     """
+    # Imported here so that the --version fast path in main() avoids it
+    import argparse
+
     parser = argparse.ArgumentParser(
         description=(
             "upserver - A resumable file server for uploading and downloading files"
@@ -107,6 +108,11 @@ def main():
     """
     Main CLI entry point for upserver.
     """
+    # Answer a bare version query without building the full parser
+    if sys.argv[1:] == ["--version"]:
+        print(f"upserver {__version__}")
+        return
+
     parser = create_parser()
     args = parser.parse_args()
 
@@ -145,6 +151,9 @@ def main():
 
         server_logger = ServerLogger(logger_instance)
 
+        # Imported here so that config-only invocations don't load the server
+        from .server import FileServer
+
         # Create and start server
         server = FileServer(
             upload_dir=config.upload_dir,
@@ -133,18 +133,19 @@ class ResumableUploadHandler(BaseHTTPRequestHandler):
         try:
             files = []
             if os.path.exists(self.upload_dir):
-                for fname in os.listdir(self.upload_dir):
-                    fpath = os.path.join(self.upload_dir, fname)
-                    if os.path.isfile(fpath):
-                        size = os.path.getsize(fpath)
-                        mtime = os.path.getmtime(fpath)
+                with os.scandir(self.upload_dir) as entries:
+                    for entry in entries:
+                        if not entry.is_file():
+                            continue
+                        # One stat per file covers both size and mtime
+                        stat = entry.stat()
                         files.append(
                             {
-                                "name": fname,
-                                "size": size,
-                                "modified": datetime.fromtimestamp(mtime).strftime(
-                                    "%Y-%m-%d %H:%M:%S"
-                                ),
+                                "name": entry.name,
+                                "size": stat.st_size,
+                                "modified": datetime.fromtimestamp(
+                                    stat.st_mtime
+                                ).strftime("%Y-%m-%d %H:%M:%S"),
                             }
                         )
 
@@ -185,12 +186,10 @@ class ResumableUploadHandler(BaseHTTPRequestHandler):
         self.send_header("Content-Length", str(os.path.getsize(file_path)))
         self.end_headers()
 
+        # socket.sendfile uses os.sendfile where available (kernel-side copy)
+        # and falls back to a read/send loop elsewhere
         with open(file_path, "rb") as f:
-            while True:
-                chunk = f.read(8192)
-                if not chunk:
-                    break
-                self.wfile.write(chunk)
+            self.connection.sendfile(f)
 
     def handle_chunk_upload(self):
         """
@@ -2,6 +2,8 @@
 Main server module for file upload and download functionality.
 """
 
+import os
+import shutil
 import sys
 
 from datetime import datetime
@@ -11,6 +13,8 @@ from pathlib import Path
 from .handlers import ResumableUploadHandler
 from .utils import get_disk_space, ensure_directory_exists, get_system_info
 
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
 
 class FileServer:
     """
@@ -48,6 +52,7 @@ class FileServer:
             chunk_size (int): Size of upload chunks in bytes (default: 5MB)
         """
         self.upload_dir = ensure_directory_exists(upload_dir)
+        self._upload_dir_bytes = os.fsencode(self.upload_dir)
         self.temp_dir = ensure_directory_exists(self.upload_dir / "temp")
         self.host = host
         self.port = port
@@ -146,14 +151,43 @@ class FileServer:
             file_data (bytes): File content as bytes
             filename (str): Name of the file to save
 
+        Returns:
+            Path: Path to the saved file
+        """
+        # Prevent path traversal attacks by using only the filename component
+        safe_filename = Path(filename).name
+        # The data is already in memory, so write it with raw os-level calls on
+        # a pre-encoded path, skipping the buffered file object entirely
+        path_bytes = self._upload_dir_bytes + b"/" + os.fsencode(safe_filename)
+        fd = os.open(path_bytes, _WRITE_FLAGS, 0o666)
+        try:
+            view = memoryview(file_data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        return self.upload_dir / safe_filename
+
+    def upload_file_stream(self, src_fileobj, filename):
+        """
+        Upload a file to the server from a binary file-like object.
+
+        The content is copied in chunks of ``chunk_size`` bytes, so memory
+        use does not grow with the size of the file.
+
+        Args:
+            src_fileobj: Readable binary file-like object
+            filename (str): Name of the file to save
+
         Returns:
             Path: Path to the saved file
         """
         # Prevent path traversal attacks by using only the filename component
         safe_filename = Path(filename).name
         file_path = self.upload_dir / safe_filename
+        # Buffered writer: unlike raw FileIO it retries short writes
         with open(file_path, "wb") as f:
-            f.write(file_data)
+            shutil.copyfileobj(src_fileobj, f, length=self.chunk_size)
         return file_path
 
     def download_file(self, filename):
@@ -172,11 +206,45 @@ class FileServer:
         # Prevent path traversal attacks by using only the filename component
         safe_filename = Path(filename).name
         file_path = self.upload_dir / safe_filename
-        if not file_path.exists():
+        try:
+            return file_path.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File '{filename}' not found") from None
+
+    def iter_download(self, filename):
+        """
+        Download a file from the server in chunks.
+
+        Args:
+            filename (str): Name of the file to download
+
+        Returns:
+            Iterator[bytes]: File content in chunks of at most ``chunk_size``
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+        """
+        # Prevent path traversal attacks by using only the filename component
+        safe_filename = Path(filename).name
+        file_path = self.upload_dir / safe_filename
+        # Check up front so a missing file is reported here, not on first read;
+        # the file itself is only opened once iteration starts, so an iterator
+        # that is never consumed holds no file handle
+        if not file_path.is_file():
             raise FileNotFoundError(f"File '{filename}' not found")
 
+        return self._read_chunks(file_path)
+
+    def _read_chunks(self, file_path):
+        """
+        Yield the content of a file in chunks of at most ``chunk_size`` bytes.
+        """
         with open(file_path, "rb") as f:
-            return f.read()
+            while True:
+                chunk = f.read1(self.chunk_size)
+                if not chunk:
+                    break
+                yield chunk
 
     def list_files(self):
         """
@@ -185,4 +253,17 @@ class FileServer:
         Returns:
             list: List of filenames
         """
-        return [f.name for f in self.upload_dir.iterdir() if f.is_file()]
+        with os.scandir(self.upload_dir) as entries:
+            return [e.name for e in entries if e.is_file()]
+
+    def iter_files(self):
+        """
+        Iterate over the files in the upload directory with their sizes.
+
+        Yields:
+            tuple: (filename, size in bytes) for each file
+        """
+        with os.scandir(self.upload_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    yield entry.name, entry.stat().st_size
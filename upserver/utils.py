@@ -5,6 +5,8 @@ Utility functions for the upserver package.
 import os
 import shutil
 import platform
+import time
+from functools import lru_cache
 from pathlib import Path
 import unicodedata
 
@@ -21,8 +23,10 @@ def sanitize_filename(filename):
     Returns:
         str: Sanitized filename
     """
-    # Remove spaces, quotes and any directory components
-    name = os.path.basename(filename.strip().strip("'\""))
+    # Remove spaces, quotes and any directory components. Both separator
+    # styles are handled regardless of the host OS, since clients on any
+    # platform may send either.
+    name = filename.strip().strip("'\"").rpartition("/")[2].rpartition("\\")[2]
 
     # Normalize Unicode to NFC
     name = unicodedata.normalize("NFC", name)
@@ -71,33 +75,61 @@ def sanitize_filename(filename):
     return name
 
 
-def get_disk_space(path):
+_GB_INV = 1.0 / (1024**3)
+
+# Last disk usage result: (path, monotonic timestamp, (total_gb, used_gb, free_gb))
+_EMPTY_DISK_SPACE_CACHE = (None, 0.0, (0.0, 0.0, 0.0))
+_disk_space_cache = _EMPTY_DISK_SPACE_CACHE
+
+
+def get_disk_space(path, ttl=2.0):
     """
     Get disk space information in a cross-platform way.
     Works on both Windows and Linux.
 
+    Results are cached for ``ttl`` seconds, so repeated calls for the same
+    path (e.g. on every page render) do not each hit the filesystem.
+
     Args:
         path (str): Path to check disk space for
+        ttl (float): Seconds a cached result stays valid (0 disables caching)
 
     Returns:
         tuple: (total_gb, used_gb, free_gb)
     """
+    global _disk_space_cache
+
+    now = time.monotonic()
+    cached_path, cached_time, cached_value = _disk_space_cache
+    if cached_path == path and now - cached_time < ttl:
+        return cached_value
+
     try:
         # Using shutil.disk_usage which works on both Windows and Linux
         total, used, free = shutil.disk_usage(path)
 
         # Convert to GB
-        total_gb = total / (1024**3)
-        used_gb = used / (1024**3)
-        free_gb = free / (1024**3)
-
-        return total_gb, used_gb, free_gb
+        value = (total * _GB_INV, used * _GB_INV, free * _GB_INV)
 
     except Exception as e:
         print(f"⚠️  Error getting disk space information: {e}")
         # Default values in case of error
         return 0.0, 0.0, 0.0
 
+    _disk_space_cache = (path, now, value)
+    return value
+
+
+def clear_disk_space_cache():
+    """
+    Discard the cached get_disk_space() result.
+    """
+    global _disk_space_cache
+    _disk_space_cache = _EMPTY_DISK_SPACE_CACHE
+
+
+_SIZE_NAMES = ("B", "KB", "MB", "GB", "TB")
+
 
 def format_file_size(size_bytes):
     """
@@ -112,13 +144,13 @@ def format_file_size(size_bytes):
     if size_bytes == 0:
         return "0 B"
 
-    size_names = ["B", "KB", "MB", "GB", "TB"]
+    # Each unit is 2**10 times the previous one, so the bit length of the
+    # size gives the unit index directly
     i = 0
-    while size_bytes >= 1024.0 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
+    if size_bytes >= 1024:
+        i = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_NAMES) - 1)
 
-    return f"{size_bytes:.2f} {size_names[i]}"
+    return f"{size_bytes / (1 << (10 * i)):.2f} {_SIZE_NAMES[i]}"
 
 
 def ensure_directory_exists(directory):
@@ -132,16 +164,17 @@ def ensure_directory_exists(directory):
         Path: Path object for the directory
     """
     path = Path(directory)
-    path.mkdir(parents=True, exist_ok=True)
+    # A single stat covers the common case of an existing directory
+    if not path.is_dir():
+        path.mkdir(parents=True, exist_ok=True)
     return path
 
 
-def get_system_info():
+@lru_cache(maxsize=1)
+def _system_info():
     """
-    Get system information for logging purposes.
-
-    Returns:
-        dict: System information
+    Collect system information once; the values cannot change while the
+    process is running.
     """
     return {
         "system": platform.system(),
@@ -150,3 +183,14 @@ def get_system_info():
         "processor": platform.processor(),
         "python_version": platform.python_version(),
     }
+
+
+def get_system_info():
+    """
+    Get system information for logging purposes.
+
+    Returns:
+        dict: System information
+    """
+    # Copy so callers can modify the result without touching the cache
+    return dict(_system_info())